@@ -41,6 +41,9 @@ JOB_VERSION?=v1
 # complete job name with version
 JOB_TAG?=$(JOB)-$(JOB_VERSION)
 
+# local directory with job files (job json, batch describe output, timeline)
+JOBS_DIR?=jobs
+
 # run locally (TRUE or FALSE)
 RUN_LOCAL?=F
 
@@ -56,6 +59,25 @@ WAIT?=T
 # user-defined parameters
 USER_PARAMETERS?=IFN=some_table.txt PARAM1=17
 
+#####################################################################################
+# job packing
+#####################################################################################
+
+# pack name (queued jobs are packed into batch jobs named <pack>-<index>)
+PACK?=grun-pack
+
+# cpus used by a packed job
+JOB_CPUS?=1
+
+# memory used by a packed job in GB
+JOB_MEMORY_GB?=1
+
+# cpus available to packed jobs per VM (should match MACHINE_TYPE)
+PACK_CPUS?=4
+
+# memory available to packed jobs per VM in GB (should match MACHINE_TYPE)
+PACK_MEMORY_GB?=14
+
 #####################################################################################
 # runtime and output parameters
 #####################################################################################
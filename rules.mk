@@ -3,6 +3,9 @@ include config.mk
 # local bucket directory
 LOCAL_BUCKET_DIR?=local_bucket
 
+# native bucket directory (holds links to host files, kept apart from the docker local bucket)
+NATIVE_BUCKET_DIR?=native_bucket
+
 #####################################################################################
 # build and upload docker image to GCR
 #####################################################################################
@@ -42,11 +45,17 @@ setup_bucket:
 #####################################################################################
 
 # job directory
-JOB_DIR?=jobs/$(JOB_TAG)
+JOB_DIR?=$(JOBS_DIR)/$(JOB_TAG)
 
 # job json
 JOB_JSON?=$(JOB_DIR)/job.json
 
+# saved output of batch job describe
+DESCRIBE_JSON?=$(JOB_DIR)/describe.json
+
+# job timeline (queue, provisioning and run times)
+TIMELINE_JSON?=$(JOB_DIR)/timeline.json
+
 ## input file short name
 INPUT_FILE_SHORT?=$(shell basename $(INPUT_FILE))
 
@@ -81,7 +90,9 @@ submit: build_json
 		--job-name $(JOB_TAG) \
 		--location $(LOCATION) \
 		--job-json $(JOB_JSON) \
-		--wait $(WAIT)
+		--wait $(WAIT) \
+		--describe-json $(DESCRIBE_JSON) \
+		--timeline-json $(TIMELINE_JSON)
 
 #####################################################################################
 # run job locally
@@ -105,6 +116,93 @@ run_local:
 	bash $(RUN_LOCAL_SCRIPT)
 	@echo "Job completed, output in $(LOCAL_BUCKET_DIR)/jobs/$(JOB_TAG)/output"
 
+# run job directly on host, without docker (links script and input file)
+run_native:
+	@python3 scripts/run_native.py \
+		--native_bucket_dir $(NATIVE_BUCKET_DIR) \
+		--job_env $(JOB_TAG) \
+		--user_script $(USER_SCRIPT) \
+		--input_file $(INPUT_FILE) \
+		--user_parameters "$(USER_PARAMETERS)"
+
+#####################################################################################
+# pack many small jobs into shared batch jobs
+#####################################################################################
+
+# local pack directory
+PACK_DIR?=packs/$(PACK)
+
+# queued jobs of pack
+PACK_QUEUE?=$(PACK_DIR)/queue.json
+
+## script that runs packed jobs concurrently on a VM
+DISPATCH_SCRIPT?=scripts/dispatch_pack.sh
+
+## bucket path or local bucket directory
+ifeq ($(RUN_LOCAL),F)
+PACK_BUCKET_DIR?=gs://$(BUCKET_NAME)
+else
+PACK_BUCKET_DIR?=$(LOCAL_BUCKET_DIR)
+endif
+
+# upload script and input file and queue job in pack
+pack_add:
+	@$(MAKE) upload_code upload_file
+	python3 scripts/pack_jobs.py add \
+		--queue_file $(PACK_QUEUE) \
+		--job_tag $(JOB_TAG) \
+		--run_script_path $(SCRIPT_PATH) \
+		--user_parameters "$(USER_PARAMETERS)" \
+		--cpus $(JOB_CPUS) \
+		--memory_gb $(JOB_MEMORY_GB)
+
+# bin-pack queued jobs and upload manifests and dispatcher
+pack_build:
+	python3 scripts/pack_jobs.py build \
+		--queue_file $(PACK_QUEUE) \
+		--pack $(PACK) \
+		--output_dir $(PACK_DIR) \
+		--cpus $(PACK_CPUS) \
+		--memory_gb $(PACK_MEMORY_GB)
+	@$(MAKE) upload_code USER_SCRIPT=$(DISPATCH_SCRIPT)
+ifeq ($(RUN_LOCAL),F)
+	-gsutil -m rm -f 'gs://$(BUCKET_NAME)/packs/$(PACK)/*.tsv'
+	gsutil -m cp $(PACK_DIR)/*.tsv gs://$(BUCKET_NAME)/packs/$(PACK)/
+else
+	mkdir -p $(LOCAL_BUCKET_DIR)/packs/$(PACK)
+	rm -f $(LOCAL_BUCKET_DIR)/packs/$(PACK)/*.tsv
+	cp $(PACK_DIR)/*.tsv $(LOCAL_BUCKET_DIR)/packs/$(PACK)/
+endif
+
+# submit queued jobs of pack as a few shared batch jobs
+pack_submit:
+	@$(MAKE) pack_build
+	for bin in $$(cat $(PACK_DIR)/bins.txt); do \
+		$(MAKE) submit JOB_TAG=$$bin WAIT=F \
+			SCRIPT_PATH=$(DISPATCH_SCRIPT) \
+			USER_PARAMETERS="PACK_MANIFEST=packs/$(PACK)/$$bin.tsv" || exit 1; \
+	done
+	@echo "Submitted pack $(PACK), check job exit codes with: grun pack_status --pack $(PACK)"
+
+# failing bins do not stop the loop, pack_status reports per-job exit codes and sets the exit status
+# run queued jobs of pack locally with the dispatcher
+pack_run_local:
+	@$(MAKE) pack_build RUN_LOCAL=T
+	for bin in $$(cat $(PACK_DIR)/bins.txt); do \
+		$(MAKE) prepare_local JOB_TAG=$$bin \
+			SCRIPT_PATH=$(DISPATCH_SCRIPT) \
+			USER_PARAMETERS="PACK_MANIFEST=packs/$(PACK)/$$bin.tsv" || exit 1; \
+		bash $(RUN_LOCAL_SCRIPT) || true; \
+	done
+	@$(MAKE) pack_status RUN_LOCAL=T
+
+# report exit code of each packed job
+pack_status:
+	python3 scripts/pack_jobs.py status \
+		--queue_file $(PACK_QUEUE) \
+		--pack $(PACK) \
+		--bucket_dir $(PACK_BUCKET_DIR)
+
 #####################################################################################
 # download results to local computer
 #####################################################################################
@@ -128,6 +226,19 @@ show:
 list_jobs:
 	gcloud batch jobs list --location=$(LOCATION)
 
+# save batch status events of job
+describe_job:
+	@mkdir -p $(JOB_DIR)
+	gcloud batch jobs describe $(JOB_TAG) --location=$(LOCATION) --format=json > $(DESCRIBE_JSON)
+
+# compute queue, provisioning and run times of job
+timeline:
+	python3 scripts/job_timeline.py --describe_json $(DESCRIBE_JSON) --output_file $(TIMELINE_JSON)
+
+# report latency percentiles by machine type, region and provisioning model
+latency_report:
+	python3 scripts/latency_report.py --jobs_dir $(JOBS_DIR)
+
 # show space usage per job in bucket
 space:
 	python3 scripts/space_usage.py --bucket_name $(BUCKET_NAME)
@@ -0,0 +1,62 @@
+#!/bin/bash
+
+# Runs all jobs listed in a pack manifest concurrently on a single VM.
+# Each manifest line is tab-separated: <job_tag> <script_path> <user_parameters>
+# Expects MNT_DIR and PACK_MANIFEST (path relative to MNT_DIR) in the environment.
+
+if [ -z "$MNT_DIR" ] || [ -z "$PACK_MANIFEST" ]; then
+  echo "Error: MNT_DIR and PACK_MANIFEST must be set"
+  exit 1
+fi
+
+MANIFEST=$MNT_DIR/$PACK_MANIFEST
+EXIT_CODES=${MANIFEST%.tsv}.exit_codes.tsv
+
+if [ ! -f "$MANIFEST" ]; then
+  echo "Error: pack manifest not found: $MANIFEST"
+  exit 1
+fi
+
+# run a single packed job as if it had its own VM, prefixing its output with the job tag
+run_packed_job() {
+  local tag="$1" script="$2" params="$3"
+  local output_dir="$MNT_DIR/jobs/$tag/output"
+  mkdir -p "$output_dir"
+  (
+    export JOB="$tag"
+    for param in $params; do
+      export "$param"
+    done
+    bash "$MNT_DIR/$script"
+  ) > >(sed "s/^/[$tag] /") 2>&1
+  local code=$?
+  echo "$code" > "$output_dir/exit_code"
+  return $code
+}
+
+PIDS=()
+TAGS=()
+while IFS=$'\t' read -r tag script params; do
+  [ -z "$tag" ] && continue
+  echo "Starting packed job: $tag"
+  run_packed_job "$tag" "$script" "$params" &
+  PIDS+=($!)
+  TAGS+=("$tag")
+done < "$MANIFEST"
+
+: > "$EXIT_CODES"
+FAILED=0
+for i in "${!PIDS[@]}"; do
+  wait "${PIDS[$i]}"
+  code=$?
+  echo "Packed job ${TAGS[$i]} finished with exit code $code"
+  printf '%s\t%s\n' "${TAGS[$i]}" "$code" >> "$EXIT_CODES"
+  if [ "$code" -ne 0 ]; then
+    FAILED=$((FAILED + 1))
+  fi
+done
+
+echo "Pack finished: $((${#PIDS[@]} - FAILED)) succeeded, $FAILED failed"
+if [ "$FAILED" -gt 0 ]; then
+  exit 1
+fi
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime, timezone
+
+# batch reports job state transitions as free-text status events
+STATE_CHANGE_RE = re.compile(r'Job state is set from (\w+) to (\w+)')
+
+# states after which the job no longer runs
+TERMINAL_STATES = ['SUCCEEDED', 'FAILED', 'DELETION_IN_PROGRESS']
+
+def parse_time(value):
+    """Parse a batch RFC3339 timestamp (nanosecond precision) into a datetime"""
+    if not value:
+        return None
+    match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})?$', value)
+    if not match:
+        raise ValueError(f"unrecognized timestamp: {value}")
+    base, fraction, zone = match.groups()
+    # python only supports microseconds, so truncate the fraction
+    fraction = (fraction or '.0')[:7]
+    zone = '+00:00' if zone in (None, 'Z') else zone
+    return datetime.fromisoformat(f"{base}{fraction}{zone}").astimezone(timezone.utc)
+
+def seconds_between(start, end):
+    """Return seconds between two datetimes, or None if either is missing"""
+    if start is None or end is None:
+        return None
+    return round((end - start).total_seconds(), 3)
+
+def get_state_events(job):
+    """Return the job state transitions as a time-sorted list of (state, datetime)"""
+    events = []
+    create_time = parse_time(job.get('createTime'))
+    if create_time:
+        # jobs enter the queue when they are created
+        events.append(('QUEUED', create_time))
+    for event in job.get('status', {}).get('statusEvents', []):
+        match = STATE_CHANGE_RE.search(event.get('description', ''))
+        time = parse_time(event.get('eventTime'))
+        # events without a timestamp cannot be placed on the timeline
+        if not match or time is None:
+            continue
+        events.append((match.group(2), time))
+    events.sort(key=lambda x: x[1])
+    return events
+
+def first_time(events, states):
+    """Return the time the job first entered any of the given states"""
+    for state, time in events:
+        if state in states:
+            return time
+    return None
+
+def parse_describe(job):
+    """Compute the timeline of a job from its 'gcloud batch jobs describe' JSON"""
+    name = job.get('name', '')
+    match = re.search(r'/locations/([^/]+)/', name)
+    region = match.group(1) if match else 'unknown'
+
+    instances = job.get('allocationPolicy', {}).get('instances', [{}])
+    policy = instances[0].get('policy', {}) if instances else {}
+
+    events = get_state_events(job)
+    queued = first_time(events, ['QUEUED'])
+    scheduled = first_time(events, ['SCHEDULED'])
+    running = first_time(events, ['RUNNING'])
+    finished = first_time(events, TERMINAL_STATES)
+
+    return {
+        'job_name': name.split('/')[-1],
+        'state': job.get('status', {}).get('state', 'UNKNOWN'),
+        'machine_type': policy.get('machineType', 'unknown'),
+        'region': region,
+        'provisioning_model': policy.get('provisioningModel', 'STANDARD'),
+        'events': [{'state': state, 'time': time.isoformat()} for state, time in events],
+        'queue_seconds': seconds_between(queued, scheduled),
+        'provisioning_seconds': seconds_between(scheduled, running),
+        'run_seconds': seconds_between(running, finished),
+        'total_seconds': seconds_between(queued, finished)
+    }
+
+def format_seconds(value):
+    """Format seconds in human readable format"""
+    if value is None:
+        return "-"
+    if value < 60:
+        return f"{value:.1f}s"
+    elif value < 3600:
+        return f"{value / 60:.1f}m"
+    else:
+        return f"{value / 3600:.2f}h"
+
+def main():
+    parser = argparse.ArgumentParser(description="compute queue, provisioning and run times of a batch job")
+    parser.add_argument('--describe_json', required=True, help='output of "gcloud batch jobs describe --format=json"')
+    parser.add_argument('--output_file', help='optional file to write the job timeline to')
+
+    args = parser.parse_args()
+
+    try:
+        with open(args.describe_json, 'r') as f:
+            job = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"error reading {args.describe_json}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    timeline = parse_describe(job)
+
+    print(f"job {timeline['job_name']} ({timeline['state']}) on {timeline['machine_type']}, "
+          f"{timeline['region']}, {timeline['provisioning_model']}")
+    for event in timeline['events']:
+        print(f"  {event['time']}  {event['state']}")
+    print(f"queue time:        {format_seconds(timeline['queue_seconds'])}")
+    print(f"provisioning time: {format_seconds(timeline['provisioning_seconds'])}")
+    print(f"run time:          {format_seconds(timeline['run_seconds'])}")
+    print(f"total time:        {format_seconds(timeline['total_seconds'])}")
+
+    if args.output_file:
+        with open(args.output_file, 'w') as f:
+            json.dump(timeline, f, indent=2)
+        print(f"timeline written to {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from job_timeline import parse_describe, format_seconds
+
+# latency components reported per job
+METRICS = ['queue_seconds', 'provisioning_seconds', 'run_seconds', 'total_seconds']
+
+# percentiles reported per group
+PERCENTILES = [50, 90, 99]
+
+def load_timelines(jobs_dir):
+    """Compute timelines for all jobs with a saved describe.json under jobs_dir"""
+    timelines = []
+    for path in sorted(glob.glob(os.path.join(jobs_dir, '*', 'describe.json'))):
+        try:
+            with open(path, 'r') as f:
+                timelines.append(parse_describe(json.load(f)))
+        except (ValueError, AttributeError, TypeError, KeyError) as e:
+            print(f"skipping {path}: {e}", file=sys.stderr)
+    return timelines
+
+def percentile(values, p):
+    """Return the p-th percentile of values using linear interpolation"""
+    values = sorted(values)
+    if not values:
+        return None
+    k = (len(values) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (k - lower)
+
+def group_timelines(timelines):
+    """Compute latency percentiles grouped by machine type, region and provisioning model"""
+    groups = {}
+    for timeline in timelines:
+        key = (timeline['machine_type'], timeline['region'], timeline['provisioning_model'])
+        groups.setdefault(key, []).append(timeline)
+
+    report = []
+    for (machine_type, region, provisioning_model), members in sorted(groups.items()):
+        entry = {
+            'machine_type': machine_type,
+            'region': region,
+            'provisioning_model': provisioning_model,
+            'job_count': len(members)
+        }
+        for metric in METRICS:
+            values = [t[metric] for t in members if t[metric] is not None]
+            entry[metric] = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+        report.append(entry)
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="report queue, provisioning and run time percentiles of batch jobs")
+    parser.add_argument('--jobs_dir', required=True, help='directory with a <job>/describe.json per job')
+    parser.add_argument('--format', choices=['human', 'json'], default='human',
+                       help='output format (default: human)')
+
+    args = parser.parse_args()
+
+    timelines = load_timelines(args.jobs_dir)
+    if not timelines:
+        print(f"no job descriptions found in {args.jobs_dir}")
+        return
+
+    report = group_timelines(timelines)
+
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+        return
+
+    # human readable format
+    labels = [f"p{p}" for p in PERCENTILES]
+    print(f"latency percentiles ({'/'.join(labels)}) over {len(timelines)} jobs in {args.jobs_dir}")
+    for entry in report:
+        print("-" * 60)
+        print(f"{entry['machine_type']}, {entry['region']}, {entry['provisioning_model']} "
+              f"({entry['job_count']} jobs)")
+        for metric in METRICS:
+            values = ' / '.join(format_seconds(entry[metric][label]) for label in labels)
+            print(f"  {metric.replace('_seconds', ''):<15} {values}")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+def load_queue(queue_file):
+    """Load the list of queued jobs, or an empty list if nothing was queued yet"""
+    if not os.path.exists(queue_file):
+        return []
+    with open(queue_file, 'r') as f:
+        return json.load(f)
+
+def save_queue(queue_file, queue):
+    """Write the list of queued jobs"""
+    queue_dir = os.path.dirname(queue_file)
+    if queue_dir:
+        os.makedirs(queue_dir, exist_ok=True)
+    with open(queue_file, 'w') as f:
+        json.dump(queue, f, indent=2)
+
+def add_job(args):
+    """Queue a job in the pack, replacing any previous entry with the same tag"""
+    if args.cpus <= 0 or args.memory_gb <= 0:
+        print("error: cpus and memory_gb must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    queue = [job for job in load_queue(args.queue_file) if job['job_tag'] != args.job_tag]
+    queue.append({
+        'job_tag': args.job_tag,
+        'run_script_path': args.run_script_path,
+        'user_parameters': args.user_parameters,
+        'cpus': args.cpus,
+        'memory_gb': args.memory_gb
+    })
+    save_queue(args.queue_file, queue)
+    print(f"queued job {args.job_tag} ({args.cpus:g} cpus, {args.memory_gb:g} GB), {len(queue)} jobs in {args.queue_file}")
+
+def pack_bins(queue, cpus, memory_gb):
+    """
+    Assign jobs to bins of the given capacity using first-fit decreasing.
+    Returns a list of bins, each a list of jobs.
+    """
+    bins = []
+    for job in sorted(queue, key=lambda x: (x['cpus'], x['memory_gb']), reverse=True):
+        for members in bins:
+            used_cpus = sum(j['cpus'] for j in members)
+            used_memory = sum(j['memory_gb'] for j in members)
+            if used_cpus + job['cpus'] <= cpus and used_memory + job['memory_gb'] <= memory_gb:
+                members.append(job)
+                break
+        else:
+            bins.append([job])
+    return bins
+
+def build_bins(args):
+    """Bin-pack queued jobs and write one manifest per bin"""
+    queue = load_queue(args.queue_file)
+    if not queue:
+        print(f"error: no jobs queued in {args.queue_file}", file=sys.stderr)
+        sys.exit(1)
+
+    too_large = [job['job_tag'] for job in queue
+                 if job['cpus'] > args.cpus or job['memory_gb'] > args.memory_gb]
+    if too_large:
+        print(f"error: jobs exceed pack capacity of {args.cpus:g} cpus, {args.memory_gb:g} GB: "
+              f"{', '.join(too_large)}", file=sys.stderr)
+        sys.exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # remove manifests of previous builds
+    for path in glob.glob(os.path.join(args.output_dir, '*.tsv')):
+        os.remove(path)
+
+    bins = pack_bins(queue, args.cpus, args.memory_gb)
+    bin_names = []
+    for i, members in enumerate(bins):
+        bin_name = f"{args.pack}-{i}"
+        bin_names.append(bin_name)
+        with open(os.path.join(args.output_dir, f"{bin_name}.tsv"), 'w') as f:
+            for job in members:
+                f.write(f"{job['job_tag']}\t{job['run_script_path']}\t{job['user_parameters']}\n")
+        print(f"{bin_name}: {', '.join(job['job_tag'] for job in members)} "
+              f"({sum(j['cpus'] for j in members):g} cpus, {sum(j['memory_gb'] for j in members):g} GB)")
+
+    with open(os.path.join(args.output_dir, 'bins.txt'), 'w') as f:
+        f.write('\n'.join(bin_names) + '\n')
+    print(f"packed {len(queue)} jobs into {len(bins)} batch jobs")
+
+def read_exit_codes(bucket_dir, pack):
+    """Read per-job exit codes written by the dispatcher, from a gs:// bucket or a local directory"""
+    pattern = f"{bucket_dir}/packs/{pack}/*.exit_codes.tsv"
+    if bucket_dir.startswith('gs://'):
+        result = subprocess.run(f"gsutil cat '{pattern}'", shell=True, capture_output=True, text=True)
+        lines = result.stdout.split('\n') if result.returncode == 0 else []
+    else:
+        lines = []
+        for path in glob.glob(pattern):
+            with open(path, 'r') as f:
+                lines.extend(f.read().split('\n'))
+
+    exit_codes = {}
+    for line in lines:
+        fields = line.strip().split('\t')
+        if len(fields) == 2:
+            exit_codes[fields[0]] = int(fields[1])
+    return exit_codes
+
+def report_status(args):
+    """Report the exit code of each queued job"""
+    queue = load_queue(args.queue_file)
+    exit_codes = read_exit_codes(args.bucket_dir, args.pack)
+
+    print(f"{'Job Tag':<30} {'Status':<10} {'Exit Code':<10}")
+    print("-" * 50)
+    counts = {'succeeded': 0, 'failed': 0, 'pending': 0}
+    for job in queue:
+        code = exit_codes.get(job['job_tag'])
+        if code is None:
+            status = 'pending'
+        elif code == 0:
+            status = 'succeeded'
+        else:
+            status = 'failed'
+        counts[status] += 1
+        print(f"{job['job_tag']:<30} {status:<10} {'-' if code is None else code:<10}")
+    print("-" * 50)
+    print(', '.join(f"{count} {status}" for status, count in counts.items()))
+
+    sys.exit(1 if counts['failed'] > 0 else 0)
+
+def main():
+    parser = argparse.ArgumentParser(description="pack many small jobs into shared batch jobs")
+    subparsers = parser.add_subparsers(dest='action', required=True)
+
+    add_parser = subparsers.add_parser('add', help='queue a job in the pack')
+    add_parser.add_argument('--queue_file', required=True, help='pack queue file')
+    add_parser.add_argument('--job_tag', required=True, help='job tag (output is written to jobs/<job_tag>/output)')
+    add_parser.add_argument('--run_script_path', required=True, help='path to the job script within the bucket')
+    add_parser.add_argument('--user_parameters', default='', help='user-defined parameters')
+    add_parser.add_argument('--cpus', type=float, required=True, help='cpus used by the job')
+    add_parser.add_argument('--memory_gb', type=float, required=True, help='memory used by the job in GB')
+
+    build_parser = subparsers.add_parser('build', help='bin-pack queued jobs into manifests')
+    build_parser.add_argument('--queue_file', required=True, help='pack queue file')
+    build_parser.add_argument('--pack', required=True, help='pack name, used as prefix of batch job names')
+    build_parser.add_argument('--output_dir', required=True, help='directory to write manifests to')
+    build_parser.add_argument('--cpus', type=float, required=True, help='cpus available per VM')
+    build_parser.add_argument('--memory_gb', type=float, required=True, help='memory available per VM in GB')
+
+    status_parser = subparsers.add_parser('status', help='report exit codes of packed jobs')
+    status_parser.add_argument('--queue_file', required=True, help='pack queue file')
+    status_parser.add_argument('--pack', required=True, help='pack name')
+    status_parser.add_argument('--bucket_dir', required=True, help='bucket (gs://<bucket>) or local bucket directory')
+
+    args = parser.parse_args()
+
+    if args.action == 'add':
+        add_job(args)
+    elif args.action == 'build':
+        build_bins(args)
+    else:
+        report_status(args)
+
+if __name__ == "__main__":
+    main()
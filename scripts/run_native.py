@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+def link_file(source, target):
+    """Symlink target to source, replacing any previous copy or link"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    # source already is the target (or is already linked), removing it would delete it
+    if os.path.realpath(source) == os.path.realpath(target):
+        return
+    if os.path.lexists(target):
+        os.remove(target)
+    os.symlink(os.path.abspath(source), target)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a job directly on the host, without Docker.")
+
+    # Required arguments
+    parser.add_argument("--native_bucket_dir", required=True, help="Local directory used as the bucket (MNT_DIR).")
+    parser.add_argument("--job_env", required=True, help="Value for the JOB environment variable.")
+    parser.add_argument("--user_script", required=True, help="Path to the job script on the host.")
+
+    # Optional arguments
+    parser.add_argument("--input_file", help="Optional input file to link into the job directory.")
+    parser.add_argument("--user_parameters", default="", help="User-defined parameters.")
+
+    args = parser.parse_args()
+
+    mnt_dir = os.path.abspath(args.native_bucket_dir)
+    job_dir = os.path.join(mnt_dir, "jobs", args.job_env)
+    output_dir = os.path.join(job_dir, "output")
+    script_path = os.path.join(mnt_dir, "scripts", os.path.basename(args.user_script))
+
+    # link instead of copying, so edits to the script or input take effect immediately
+    if not os.path.exists(args.user_script):
+        print(f"Error: user script not found: {args.user_script}", file=sys.stderr)
+        sys.exit(1)
+    link_file(args.user_script, script_path)
+    if args.input_file:
+        if not os.path.exists(args.input_file):
+            print(f"Error: input file not found: {args.input_file}", file=sys.stderr)
+            sys.exit(1)
+        link_file(args.input_file, os.path.join(job_dir, os.path.basename(args.input_file)))
+    os.makedirs(output_dir, exist_ok=True)
+
+    # same environment contract as the container
+    env = dict(os.environ)
+    env["MNT_DIR"] = mnt_dir
+    env["JOB"] = args.job_env
+    if args.user_parameters:
+        for param in args.user_parameters.split():
+            if '=' in param:
+                key, value = param.split('=', 1)
+                env[key] = value
+
+    log_file = os.path.join(output_dir, "run.log")
+    if os.path.exists(log_file):
+        os.remove(log_file)
+
+    # stream output to the terminal while keeping a copy for the log
+    start = time.time()
+    lines = []
+    process = subprocess.Popen(["bash", script_path], cwd=mnt_dir, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    try:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            lines.append(line)
+        exit_code = process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        exit_code = process.wait()
+    elapsed = time.time() - start
+
+    # report termination by signal the same way the shell does
+    if exit_code < 0:
+        exit_code = 128 - exit_code
+
+    # the job script usually writes its own run.log, otherwise write the captured output
+    if not os.path.exists(log_file):
+        with open(log_file, 'w') as f:
+            f.writelines(lines)
+
+    with open(os.path.join(output_dir, "exit_code"), 'w') as f:
+        f.write(f"{exit_code}\n")
+
+    print(f"Job {args.job_env} finished with exit code {exit_code} in {elapsed:.2f}s")
+    print(f"Output in {output_dir}")
+    sys.exit(exit_code)
+
+if __name__ == "__main__":
+    main()
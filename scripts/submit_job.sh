@@ -3,7 +3,7 @@
 set -e
 
 usage() {
-  echo "Usage: $0 --job-name <job-name> --location <location> --job-json <job-json-path> --wait <T/F>"
+  echo "Usage: $0 --job-name <job-name> --location <location> --job-json <job-json-path> --wait <T/F> [--describe-json <path>] [--timeline-json <path>]"
   exit 1
 }
 
@@ -15,6 +15,8 @@ while [[ "$#" -gt 0 ]]; do
     --location) LOCATION="$2"; shift ;;
     --job-json) JOB_JSON="$2"; shift ;;
     --wait) WAIT_FLAG="$2"; shift ;;
+    --describe-json) DESCRIBE_JSON="$2"; shift ;;
+    --timeline-json) TIMELINE_JSON="$2"; shift ;;
     *) echo "Unknown parameter passed: $1"; usage ;;
   esac
   shift
@@ -53,6 +55,16 @@ if [ "$WAIT_FLAG" == "T" ]; then
 
     echo "Job finished with status: $STATUS"
 
+    # save status events to compute queue, provisioning and run times (best-effort, keeps job status)
+    if [ -n "$DESCRIBE_JSON" ]; then
+      gcloud batch jobs describe "$JOB_NAME" --location="$LOCATION" --format=json > "$DESCRIBE_JSON" \
+        || echo "warning: could not save job description"
+      if [ -n "$TIMELINE_JSON" ]; then
+        python3 "$(dirname "$0")/job_timeline.py" --describe_json "$DESCRIBE_JSON" --output_file "$TIMELINE_JSON" \
+          || echo "warning: could not save job timeline"
+      fi
+    fi
+
     if [[ "$STATUS" == "FAILED" ]]; then
       exit 1
     fi